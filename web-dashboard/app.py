@@ -3,130 +3,550 @@
 Coral Web Dashboard - Simple web interface for Coral node
 """
 
-from flask import Flask, render_template, jsonify, request
-import subprocess
-import json
+from flask import Flask, Response, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple, Optional
+from requests.adapters import HTTPAdapter
+from urllib.parse import quote
+from functools import lru_cache
+from rpc_convert import CONVERT_PARAMS
+import orjson
+import queue
+import requests
+import stat
+import string
+import tempfile
+import threading
+import time
+import uuid
+import sys
 import os
 
+# Under gunicorn's gevent workers a blocking zmq recv would stall the whole worker
+if 'gevent.monkey' in sys.modules and sys.modules['gevent.monkey'].is_module_patched('socket'):
+    import zmq.green as zmq
+else:
+    import zmq
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialize responses with orjson; RPC payloads like the raw mempool can be megabytes"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Configuration
-CORAL_CLI = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src', 'coral-cli')
 # Default data directory: ~/Library/Application Support/Coral on macOS
 DATADIR = os.path.expanduser('~/Library/Application Support/Coral')
+RPC_HOST = '127.0.0.1'
 
-def coral_cli(command, *args):
-    """Execute coral-cli command and return result"""
-    cmd = [CORAL_CLI, f'-datadir={DATADIR}'] + command.split() + list(args)
+# Chain name -> (subdirectory of DATADIR, default RPC port), as in src/chainparamsbase.cpp
+CHAINS = {'main': ('', 8332), 'test': ('testnet3', 18332), 'signet': ('signet', 38332), 'regtest': ('regtest', 18443)}
+# Options the node only reads from the [<chain>] section on non-main chains (ArgsManager::NETWORK_ONLY)
+NETWORK_ONLY_KEYS = frozenset({'addnode', 'bind', 'connect', 'port', 'rpcbind', 'rpcport', 'wallet', 'walletdir'})
+
+def _conf_bool(value):
+    """Interpret a boolean option like the node: empty means true, otherwise a nonzero integer"""
+    try:
+        return not value or int(value) != 0
+    except ValueError:
+        return False
+
+def read_config(path):
+    """Parse coral.conf the way the node does; returns (chain, settings for that chain)"""
+    sections = {}  # section ('' for the top level) -> {key: value}; the first assignment wins
+    chain_args = {}  # regtest/signet/testnet/chain from the top level; the last assignment wins
+    section = ''
+    try:
+        with open(path, encoding='utf8') as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if line.startswith('[') and line.endswith(']'):
+                    section = line[1:-1].strip()
+                    continue
+                if '=' not in line:
+                    continue
+                key, value = (s.strip() for s in line.split('=', 1))
+                name = section
+                if not name and '.' in key:
+                    name, key = key.split('.', 1)  # "regtest.rpcport=..." outside any section
+                if not name and key in ('regtest', 'signet', 'testnet', 'chain'):
+                    chain_args[key] = value
+                sections.setdefault(name, {}).setdefault(key, value)
+    except OSError:
+        pass
+
+    chain = next((net for flag, net in (('regtest', 'regtest'), ('signet', 'signet'), ('testnet', 'test')) if _conf_bool(chain_args.get(flag, '0'))),
+                 chain_args.get('chain', 'main'))
+    conf = {key: value for key, value in sections.get('', {}).items() if chain == 'main' or key not in NETWORK_ONLY_KEYS}
+    conf.update(sections.get(chain, {}))
+    return chain, conf
+
+def read_auth(conf):
+    """Get RPC credentials from coral.conf, falling back to the node's .cookie file"""
+    if 'rpcuser' in conf and 'rpcpassword' in conf:
+        return conf['rpcuser'], conf['rpcpassword']
+    # Like the node, resolve a relative rpccookiefile against the chain's data directory
+    cookie = os.path.join(DATADIR_NET, conf.get('rpccookiefile', '.cookie'))
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
+        with open(cookie, encoding='utf8') as f:
+            user, password = f.read().strip().split(':', 1)
+            return user, password
+    except (OSError, ValueError):
+        return None
+
+CHAIN, CONF = read_config(os.path.join(DATADIR, 'coral.conf'))
+NETDIR, DEFAULT_RPC_PORT = CHAINS.get(CHAIN, CHAINS['main'])
+DATADIR_NET = os.path.join(DATADIR, NETDIR)
+RPC_PORT = int(CONF.get('rpcport', DEFAULT_RPC_PORT))
+RPC_URL = f'http://{RPC_HOST}:{RPC_PORT}'
+RPC_AUTH = read_auth(CONF)
+
+# One keep-alive connection pool to the node, shared by all requests
+SESSION = requests.Session()
+SESSION.mount(RPC_URL, HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+# Shared pool for issuing independent RPCs concurrently when they cannot be batched
+EXEC = ThreadPoolExecutor(max_workers=8)
+
+# Long-running wallet jobs (rescans, key imports) run here and are polled via /api/task/<task_id>.
+# Their state is kept in files rather than in memory, so whichever gunicorn worker gets the poll can answer it.
+TASK_EXEC = ThreadPoolExecutor(max_workers=2)
+TASK_DIR = os.path.join(tempfile.gettempdir(), f'coral-dashboard-tasks-{os.getuid()}')
+TASK_TTL = 3600  # Finished tasks nobody fetched are dropped after this many seconds
+TASK_STALE = 86400  # Unfinished tasks are dropped after this long (their worker most likely died)
+
+def _check_task_dir(path):
+    """Create the task directory; returns an error message if it is not private to this user"""
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        st = os.lstat(path)
+    except OSError as e:
+        return str(e)
+    # The temp dir is shared: another local user could have created this path first to forge or clobber task files
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o022:
+        return f'{path} is not a directory owned by this user and closed to others'
+    return None
+
+TASK_DIR_ERROR = _check_task_dir(TASK_DIR)
+
+def _task_path(task_id):
+    return os.path.join(TASK_DIR, f'{task_id}.json')
+
+def _write_task(task_id, state):
+    """Record a task's state atomically, so a poll never reads a half-written file"""
+    tmp = f'{_task_path(task_id)}.{uuid.uuid4().hex}.tmp'
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_NOFOLLOW, 0o600)
+    with open(fd, 'wb') as f:
+        f.write(orjson.dumps(state))
+    os.replace(tmp, _task_path(task_id))
+
+def _read_task(path):
+    try:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def _evict_tasks():
+    """Remove task files that outlived TASK_TTL (finished) or TASK_STALE (unfinished)"""
+    now = time.time()
+    try:
+        entries = list(os.scandir(TASK_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            age = now - entry.stat().st_mtime
+        except OSError:
+            continue
+        if age < TASK_TTL:
+            continue
+        state = _read_task(entry.path)
+        if age >= TASK_STALE or state is None or state.get('done'):
             try:
-                return json.loads(result.stdout)
-            except json.JSONDecodeError:
-                return result.stdout.strip()
-        else:
-            return {'error': result.stderr.strip()}
-    except subprocess.TimeoutExpired:
-        return {'error': 'Command timed out'}
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+def _run_task(task_id, fn, args):
+    try:
+        result = fn(*args)
     except Exception as e:
-        return {'error': str(e)}
+        result = {'error': str(e)}
+    try:
+        _write_task(task_id, {'done': True, 'result': result})
+    except OSError:
+        app.logger.exception('Could not record the result of task %s', task_id)
+
+def submit_task(fn, *args):
+    """Run fn(*args) in the background; returns (task_id, None) or (None, error message)"""
+    if TASK_DIR_ERROR:
+        return None, f'Background tasks unavailable: {TASK_DIR_ERROR}'
+    _evict_tasks()
+    task_id = uuid.uuid4().hex
+    try:
+        _write_task(task_id, {'done': False, 'result': None})
+    except OSError as e:
+        return None, f'Background tasks unavailable: {e}'
+    TASK_EXEC.submit(_run_task, task_id, fn, args)
+    return task_id, None
+
+class RpcResult(NamedTuple):
+    """Outcome of one RPC call: either ok with a value, or failed with an error message"""
+    ok: bool
+    value: Any
+    error: Optional[str]
+
+    def payload(self, key=None):
+        """Response body: the value (wrapped as {key: value} if key is given) or {'error': ...}"""
+        if not self.ok:
+            return {'error': self.error}
+        return {key: self.value} if key else self.value
+
+    def to_json(self, key=None):
+        return jsonify(self.payload(key))
+
+def _failed(error):
+    return RpcResult(False, None, error)
+
+@lru_cache(maxsize=64)
+def _rpc_url(wallet=None):
+    """Endpoint URL for the node, or for one of its wallets (the HTTP form of -rpcwallet=)"""
+    return f'{RPC_URL}/wallet/{quote(wallet, safe="")}' if wallet is not None else f'{RPC_URL}/'
+
+def _post(payload, wallet=None, timeout=30):
+    """POST a JSON-RPC payload to the node; returns (reply, None) or (None, RpcResult error)"""
+    global RPC_AUTH
+    url = _rpc_url(wallet)
+    for attempt in range(2):
+        try:
+            r = SESSION.post(url, auth=RPC_AUTH, json=payload, timeout=timeout)
+        except requests.Timeout:
+            return None, _failed('Command timed out')
+        except requests.RequestException as e:
+            return None, _failed(str(e))
+        if r.status_code != 401 or attempt or ('rpcuser' in CONF and 'rpcpassword' in CONF):
+            break
+        # Cookie auth: the node writes a fresh .cookie on every restart, so re-read it and retry once
+        RPC_AUTH = read_auth(CONF)
+    try:
+        return orjson.loads(r.content), None
+    except orjson.JSONDecodeError:
+        return None, _failed(f'HTTP {r.status_code} {r.reason}')
+
+def _unwrap(reply):
+    """Turn a single JSON-RPC reply object into an RpcResult"""
+    if reply.get('error'):
+        return _failed(reply['error'].get('message', str(reply['error'])))
+    return RpcResult(True, reply.get('result'), None)
+
+def coral_rpc(method, params=None, wallet=None, timeout=30):
+    """Call an RPC method on the node (optionally on a wallet endpoint) and return an RpcResult"""
+    reply, err = _post({'jsonrpc': '1.0', 'id': 'web', 'method': method, 'params': list(params or [])}, wallet, timeout)
+    return err if err else _unwrap(reply)
+
+def coral_rpc_batch(calls, wallet=None, timeout=30):
+    """Send several (method, params) calls in one JSON-RPC batch and return RpcResults in call order"""
+    if not calls:
+        return []
+    payload = [{'jsonrpc': '1.0', 'id': i, 'method': method, 'params': list(params)} for i, (method, params) in enumerate(calls)]
+    replies, err = _post(payload, wallet, timeout)
+    if err:
+        return [err] * len(calls)
+    if not isinstance(replies, list):
+        # Backend without batch support: answered with a single error object, so issue the calls in parallel instead
+        return list(EXEC.map(lambda call: coral_rpc(call[0], call[1], wallet, timeout), calls))
+    # Match replies by id: the node may reorder them, and a reply to a malformed request carries "id": null
+    by_id = {reply.get('id'): reply for reply in replies if isinstance(reply, dict)}
+    return [_unwrap(by_id[i]) if i in by_id else _failed('No reply from node') for i in range(len(calls))]
+
+# Answers that change when the tip moves are cached briefly. That includes verbose
+# getblock/getrawtransaction, whose confirmations (and nextblockhash) go stale on
+# every block. Address validation never changes and block hashes only change on a
+# reorg, so those are kept much longer.
+TIP_METHODS = frozenset({
+    'getblockchaininfo', 'getnetworkinfo', 'getmempoolinfo', 'getnettotals', 'getmininginfo', 'uptime', 'getdeploymentinfo', 'getblock',
+    'getrawtransaction'
+})
+IMMUTABLE_METHODS = frozenset({'getblockhash', 'validateaddress'})
+# On a new block, cached getblockhash answers this close to the tip are dropped in case of a reorg
+REORG_DEPTH = 100
+_tip_cache = TTLCache(maxsize=2048, ttl=3)
+_immutable_cache = TTLCache(maxsize=8192, ttl=3600)
+_cache_lock = threading.Lock()
+
+def _cacheable(method, result):
+    """Only cache successful answers; unconfirmed transactions may still change"""
+    if not result.ok:
+        return False
+    if method == 'getrawtransaction' and isinstance(result.value, dict) and 'blockhash' not in result.value:
+        return False
+    return True
+
+def _cached_tip():
+    """Chain height from the cached getblockchaininfo, if any (call with _cache_lock held)"""
+    info = _tip_cache.get(('getblockchaininfo', ()))
+    return info.value.get('blocks') if info is not None and isinstance(info.value, dict) else None
+
+def _near_tip(args, tip):
+    """True if a getblockhash(height) answer could still change in a reorg"""
+    height = args[0] if args else None
+    return tip is None or not isinstance(height, int) or height > tip - REORG_DEPTH
+
+def _invalidate_on_new_block():
+    """Drop cached answers that depend on the chain tip, and block hashes a reorg could replace"""
+    with _cache_lock:
+        tip = _cached_tip()
+        _tip_cache.clear()
+        for key in [key for key in _immutable_cache if key[0] == 'getblockhash' and _near_tip(key[1], tip)]:
+            _immutable_cache.pop(key, None)
+
+# getaddressinfo answers per (wallet, address); they only change when the wallet
+# does (key imports, labels, loading/unloading), so those paths clear it. The clear
+# only reaches this worker, so answers also expire after ADDRESS_INFO_TTL seconds.
+ADDRESS_INFO_TTL = 30
+_address_info_cache = TTLCache(maxsize=2048, ttl=ADDRESS_INFO_TTL)
+
+def _invalidate_address_info():
+    """Drop cached getaddressinfo answers after anything that may change wallet contents"""
+    with _cache_lock:
+        _address_info_cache.clear()
+
+def _invalidate_mempool():
+    """Drop cached mempool info after a new transaction"""
+    with _cache_lock:
+        for key in [key for key in _tip_cache if key[0] == 'getmempoolinfo']:
+            _tip_cache.pop(key, None)
+
+def _cache_for(method, args):
+    """Return the cache that holds answers for method, or None if it is never cached (call with _cache_lock held)"""
+    if any(isinstance(arg, (dict, list)) for arg in args):
+        return None  # Unhashable console arguments, e.g. getblockhash [1]
+    if method in TIP_METHODS:
+        return _tip_cache
+    if method == 'getblockhash' and _near_tip(args, _cached_tip()):
+        return _tip_cache
+    if method in IMMUTABLE_METHODS:
+        return _immutable_cache
+    return None
+
+def coral_cli(command, *args):
+    """Execute RPC command with positional arguments and return an RpcResult"""
+    return coral_cli_batch([(command, args)])[0]
+
+def coral_cli_batch(calls):
+    """Execute several (method, args) calls, answering from cache where possible and batching the rest"""
+    results = [None] * len(calls)
+    misses = []
+    with _cache_lock:
+        for i, (method, args) in enumerate(calls):
+            cache = _cache_for(method, args)
+            # One lookup only: a TTL entry can expire between a membership test and the read
+            hit = cache.get((method, tuple(args))) if cache is not None else None
+            if hit is not None:
+                results[i] = hit
+            else:
+                misses.append(i)
+    if len(misses) == 1:
+        method, args = calls[misses[0]]
+        fetched = [coral_rpc(method, args)]
+    else:
+        fetched = coral_rpc_batch([calls[i] for i in misses])
+    with _cache_lock:
+        for i, result in zip(misses, fetched):
+            method, args = calls[i]
+            cache = _cache_for(method, args)
+            if cache is not None and _cacheable(method, result):
+                cache[(method, tuple(args))] = result
+            results[i] = result
+    return results
+
+# Push notifications: subscribe to the node's ZMQ hashblock/hashtx feeds and
+# fan events out to every browser connected to /api/events
+ZMQ_ENDPOINTS = {
+    b'hashblock': CONF.get('zmqpubhashblock', 'tcp://127.0.0.1:28332'),
+    b'hashtx': CONF.get('zmqpubhashtx', 'tcp://127.0.0.1:28332'),
+}
+EVENT_TYPES = {b'hashblock': 'block', b'hashtx': 'tx'}
+_subscribers = []
+_subscribers_lock = threading.Lock()
+_listener_started = False
+
+def _publish(event):
+    with _subscribers_lock:
+        for q in _subscribers:
+            try:
+                q.put_nowait(event)
+            except queue.Full:
+                pass  # Slow client; it will catch up on the next event
+
+def _zmq_listener():
+    global _listener_started
+    try:
+        # Closed on the way out, so restarts triggered by new subscribers do not leak sockets in the shared context
+        with zmq.Context.instance().socket(zmq.SUB) as sock:
+            for endpoint in set(ZMQ_ENDPOINTS.values()):
+                sock.connect(endpoint)
+            for topic in ZMQ_ENDPOINTS:
+                sock.setsockopt(zmq.SUBSCRIBE, topic)
+            while True:
+                frames = sock.recv_multipart()
+                try:
+                    topic, body, _seq = frames
+                    event_type = EVENT_TYPES[topic]
+                except (KeyError, ValueError):
+                    app.logger.warning('Ignoring unexpected ZMQ message with %d frames', len(frames))
+                    continue
+                if topic == b'hashblock':
+                    _invalidate_on_new_block()
+                else:
+                    _invalidate_mempool()
+                _publish({'type': event_type, 'hash': body.hex()})
+    except Exception:
+        app.logger.exception('ZMQ listener stopped')
+    finally:
+        # Let the next /api/events subscriber start a fresh listener
+        with _subscribers_lock:
+            _listener_started = False
+
+def _ensure_listener():
+    """Start the ZMQ listener thread on first use (works under both app.run and gunicorn)"""
+    global _listener_started
+    with _subscribers_lock:
+        if _listener_started:
+            return
+        _listener_started = True
+    threading.Thread(target=_zmq_listener, name='zmq-listener', daemon=True).start()
+
+def parse_cli_arg(method, index, arg):
+    """Convert a console argument like coral-cli does: JSON for the positions in CONVERT_PARAMS, string otherwise"""
+    if index not in CONVERT_PARAMS.get(method, ()):
+        return arg
+    try:
+        return orjson.loads(arg)
+    except orjson.JSONDecodeError:
+        raise ValueError(f'Error parsing JSON: {arg}') from None
+
+def _norm_hex(s):
+    """Decode a hex string (whitespace allowed between bytes); None if it is not valid hex"""
+    try:
+        return bytes.fromhex(s)
+    except (TypeError, ValueError):
+        return None
+
+@lru_cache(maxsize=1024)
+def _norm_txid(txid):
+    """Canonical lowercase txid, or None if it is not 32 bytes of hex"""
+    raw = _norm_hex(txid)
+    return raw.hex() if raw is not None and len(raw) == 32 else None
+
+_allowed_methods = None
+
+# RPCs registered in the "hidden" category are callable but never listed by help
+HIDDEN_METHODS = frozenset({
+    'addconnection', 'addpeeraddress', 'estimaterawfee', 'invalidateblock', 'reconsiderblock', 'waitfornewblock', 'waitforblock', 'waitforblockheight',
+    'syncwithvalidationinterfacequeue', 'dumptxoutset', 'submitpackage', 'generate', 'setmocktime', 'mockscheduler', 'echo', 'echojson', 'echoipc',
+    'invokedisallowedsyscall'
+})
+
+def allowed_methods():
+    """Set of RPC methods the node knows, read once from its help output plus HIDDEN_METHODS; None if the node is unreachable"""
+    global _allowed_methods
+    if _allowed_methods is None:
+        result = coral_rpc('help')
+        if not result.ok:
+            return None
+        # help lists one method per line, grouped under "== Section ==" headers
+        listed = (line.split()[0] for line in result.value.splitlines() if line.strip() and not line.startswith('=='))
+        _allowed_methods = HIDDEN_METHODS.union(listed)
+    return _allowed_methods
+
+def parse_command(command):
+    """Split a console command into (method, args). Raises ValueError on bad JSON"""
+    parts = command.split()
+    if not parts:
+        return None, ()
+    method = parts[0]
+    return method, tuple(parse_cli_arg(method, i, arg) for i, arg in enumerate(parts[1:]))
 
 @app.route('/')
 def index():
     return render_template('index.html')
 
+# Read-only endpoints that map 1:1 onto an RPC call:
+# (path, endpoint, rpc method, fixed params, response key)
+# URL variables are passed as the leading params, except <name> which selects the wallet.
+ROUTES = [
+    ('/api/wallets', 'get_wallets', 'listwallets', (), 'wallets'),
+    ('/api/wallet/<name>', 'get_wallet_info', 'getwalletinfo', (), None),
+    ('/api/wallet/<name>/balance', 'get_balance', 'getbalance', (), 'balance'),
+    ('/api/wallet/<name>/transactions', 'get_transactions', 'listtransactions', ('*', 20), 'transactions'),
+    ('/api/wallet/<name>/utxos', 'get_utxos', 'listunspent', (), 'utxos'),
+    ('/api/wallet/<name>/addresses', 'get_addresses', 'listreceivedbyaddress', (0, True), 'addresses'),
+    ('/api/listwalletdir', 'list_wallet_dir', 'listwalletdir', (), None),
+    ('/api/peers', 'get_peers', 'getpeerinfo', (), 'peers'),
+    ('/api/banned', 'get_banned', 'listbanned', (), 'banned'),
+    ('/api/mempool', 'get_mempool', 'getmempoolinfo', (), None),
+    ('/api/rawmempool', 'get_raw_mempool', 'getrawmempool', (True, ), None),
+    ('/api/mining', 'get_mining_info', 'getmininginfo', (), None),
+    ('/api/network/hashrate', 'get_network_hashrate', 'getnetworkhashps', (), 'hashrate'),
+    ('/api/getblocktemplate', 'get_block_template', 'getblocktemplate', ({'rules': ['segwit']}, ), None),
+    ('/api/estimatesmartfee/<int:blocks>', 'estimate_smart_fee', 'estimatesmartfee', (), None),
+    ('/api/chaintips', 'get_chain_tips', 'getchaintips', (), 'chaintips'),
+    ('/api/deploymentinfo', 'get_deployment_info', 'getdeploymentinfo', (), None),
+    ('/api/rpcinfo', 'get_rpc_info', 'getrpcinfo', (), None),
+    ('/api/uptime', 'get_uptime', 'uptime', (), 'uptime'),
+    ('/api/validateaddress/<address>', 'validate_address', 'validateaddress', (), None),
+]
+
+def make_handler(method, params, key):
+    """Build a view that forwards URL variables to an RPC method and wraps its result"""
+    def handler(name=None, **url_args):
+        args = (*url_args.values(), *params)
+        if name is not None:
+            return coral_rpc(method, args, wallet=name).to_json(key)
+        return coral_cli(method, *args).to_json(key)
+    handler.__doc__ = f'Forward to the {method} RPC'
+    return handler
+
+for path, endpoint, method, params, key in ROUTES:
+    app.add_url_rule(path, endpoint, make_handler(method, params, key))
+
 @app.route('/api/info')
 def get_info():
     """Get blockchain and network info"""
-    blockchain = coral_cli('getblockchaininfo')
-    network = coral_cli('getnetworkinfo')
-    mining = coral_cli('getmininginfo')
+    blockchain, network, mining = coral_cli_batch([('getblockchaininfo', ()), ('getnetworkinfo', ()), ('getmininginfo', ())])
     return jsonify({
-        'blockchain': blockchain,
-        'network': network,
-        'mining': mining
+        'blockchain': blockchain.payload(),
+        'network': network.payload(),
+        'mining': mining.payload()
     })
 
-@app.route('/api/wallets')
-def get_wallets():
-    """List all wallets"""
-    wallets = coral_cli('listwallets')
-    return jsonify({'wallets': wallets if isinstance(wallets, list) else []})
-
-@app.route('/api/wallet/<name>')
-def get_wallet_info(name):
-    """Get specific wallet info"""
-    cmd = [CORAL_CLI, f'-datadir={DATADIR}', f'-rpcwallet={name}', 'getwalletinfo']
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return jsonify(json.loads(result.stdout))
-        return jsonify({'error': result.stderr.strip()})
-    except Exception as e:
-        return jsonify({'error': str(e)})
-
-@app.route('/api/wallet/<name>/balance')
-def get_balance(name):
-    """Get wallet balance"""
-    cmd = [CORAL_CLI, f'-datadir={DATADIR}', f'-rpcwallet={name}', 'getbalance']
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return jsonify({'balance': float(result.stdout.strip())})
-        return jsonify({'error': result.stderr.strip()})
-    except Exception as e:
-        return jsonify({'error': str(e)})
-
 @app.route('/api/wallet/<name>/newaddress', methods=['GET', 'POST'])
 def new_address(name):
     """Generate new receiving address"""
-    cmd = [CORAL_CLI, f'-datadir={DATADIR}', f'-rpcwallet={name}', 'getnewaddress']
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return jsonify({'address': result.stdout.strip()})
-        return jsonify({'error': result.stderr.strip()})
-    except Exception as e:
-        return jsonify({'error': str(e)})
-
-@app.route('/api/wallet/<name>/transactions')
-def get_transactions(name):
-    """Get recent transactions"""
-    cmd = [CORAL_CLI, f'-datadir={DATADIR}', f'-rpcwallet={name}', 'listtransactions', '*', '20']
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return jsonify({'transactions': json.loads(result.stdout)})
-        return jsonify({'error': result.stderr.strip()})
-    except Exception as e:
-        return jsonify({'error': str(e)})
+    return coral_rpc('getnewaddress', wallet=name).to_json('address')
 
 @app.route('/api/block/<hash_or_height>')
 def get_block(hash_or_height):
     """Get block by hash or height"""
     # If numeric, get hash first
     if hash_or_height.isdigit():
-        blockhash = coral_cli('getblockhash', hash_or_height)
-        if isinstance(blockhash, dict) and 'error' in blockhash:
-            return jsonify(blockhash)
+        blockhash = coral_cli('getblockhash', int(hash_or_height))
+        if not blockhash.ok:
+            return blockhash.to_json()
+        blockhash = blockhash.value
     else:
         blockhash = hash_or_height
 
-    block = coral_cli('getblock', blockhash)
-    return jsonify(block)
-
-@app.route('/api/peers')
-def get_peers():
-    """Get connected peers"""
-    peers = coral_cli('getpeerinfo')
-    return jsonify({'peers': peers if isinstance(peers, list) else []})
-
-@app.route('/api/mempool')
-def get_mempool():
-    """Get mempool info"""
-    info = coral_cli('getmempoolinfo')
-    return jsonify(info)
+    return coral_cli('getblock', blockhash).to_json()
 
 @app.route('/api/createwallet', methods=['POST'])
 def create_wallet():
@@ -134,20 +554,16 @@ def create_wallet():
     data = request.json
     name = data.get('name', 'wallet')
     # Create legacy wallet for compatibility
-    result = coral_cli('createwallet', name, 'false', 'false', '', 'false', 'false')
-    return jsonify(result)
-
-@app.route('/api/mining')
-def get_mining_info():
-    """Get mining information"""
-    info = coral_cli('getmininginfo')
-    return jsonify(info)
+    return coral_cli('createwallet', name, False, False, '', False, False).to_json()
 
 @app.route('/api/mining/generate', methods=['POST'])
 def generate_blocks():
     """Generate blocks (regtest/mining)"""
     data = request.json or {}
-    nblocks = str(data.get('blocks', 1))
+    try:
+        nblocks = int(data.get('blocks', 1))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'Invalid number of blocks'})
     address = data.get('address', '')
 
     if address:
@@ -155,42 +571,34 @@ def generate_blocks():
     else:
         # Try to get an address from loaded wallet
         wallets = coral_cli('listwallets')
-        if isinstance(wallets, list) and len(wallets) > 0:
-            cmd = [CORAL_CLI, f'-datadir={DATADIR}', f'-rpcwallet={wallets[0]}', 'getnewaddress']
-            try:
-                addr_result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                if addr_result.returncode == 0:
-                    address = addr_result.stdout.strip()
-                    result = coral_cli('generatetoaddress', nblocks, address)
-                else:
-                    return jsonify({'error': f'Could not get address: {addr_result.stderr}'})
-            except Exception as e:
-                return jsonify({'error': str(e)})
-        else:
-            error_msg = wallets.get('error', 'Unknown error') if isinstance(wallets, dict) else 'No wallet loaded'
+        if not wallets.ok or not wallets.value:
+            error_msg = wallets.error or 'No wallet loaded'
             return jsonify({'error': f'No wallet loaded. {error_msg}. Create a wallet first.'})
+        addr_result = coral_rpc('getnewaddress', wallet=wallets.value[0])
+        if not addr_result.ok:
+            return jsonify({'error': f'Could not get address: {addr_result.error}'})
+        address = addr_result.value
+        result = coral_cli('generatetoaddress', nblocks, address)
 
-    return jsonify({'result': result, 'address': address})
+    _invalidate_on_new_block()
+    return jsonify({'result': result.payload(), 'address': address})
 
 @app.route('/api/mining/setgenerate', methods=['POST'])
 def set_generate():
     """Start/stop CPU mining"""
     data = request.json or {}
     generate = data.get('generate', False)
-    threads = str(data.get('threads', 1))
+    try:
+        threads = int(data.get('threads', 1))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'Invalid number of threads'})
 
     if generate:
-        result = coral_cli('setgenerate', 'true', threads)
+        result = coral_cli('setgenerate', True, threads)
     else:
-        result = coral_cli('setgenerate', 'false')
+        result = coral_cli('setgenerate', False)
 
-    return jsonify({'result': result, 'generating': generate})
-
-@app.route('/api/network/hashrate')
-def get_network_hashrate():
-    """Get network hash rate"""
-    result = coral_cli('getnetworkhashps')
-    return jsonify({'hashrate': result})
+    return jsonify({'result': result.payload(), 'generating': generate})
 
 # ============== NEW COMPREHENSIVE ENDPOINTS ==============
 
@@ -202,63 +610,48 @@ def execute_rpc():
     if not command:
         return jsonify({'error': 'No command provided'})
 
-    # Parse command into parts
-    parts = command.split()
-    if not parts:
-        return jsonify({'error': 'Empty command'})
-
-    method = parts[0]
-    args = parts[1:] if len(parts) > 1 else []
-
-    result = coral_cli(method, *args)
-    return jsonify({'result': result})
-
-@app.route('/api/wallet/<name>/utxos')
-def get_utxos(name):
-    """Get wallet UTXOs"""
-    cmd = [CORAL_CLI, f'-datadir={DATADIR}', f'-rpcwallet={name}', 'listunspent']
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return jsonify({'utxos': json.loads(result.stdout)})
-        return jsonify({'error': result.stderr.strip()})
-    except Exception as e:
+        method, args = parse_command(command)
+    except ValueError as e:
         return jsonify({'error': str(e)})
+    if not method:
+        return jsonify({'error': 'Empty command'})
+    # Reject typos locally instead of spending a node round trip on them
+    methods = allowed_methods()
+    if methods is not None and method not in methods:
+        return jsonify({'error': f'Unknown method {method}'})
 
-@app.route('/api/wallet/<name>/addresses')
-def get_addresses(name):
-    """Get wallet addresses"""
-    cmd = [CORAL_CLI, f'-datadir={DATADIR}', f'-rpcwallet={name}', 'listreceivedbyaddress', '0', 'true']
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            addresses = json.loads(result.stdout)
-            return jsonify({'addresses': addresses})
-        return jsonify({'error': result.stderr.strip()})
-    except Exception as e:
-        return jsonify({'error': str(e)})
+    result = coral_cli(method, *args)
+    _invalidate_address_info()  # The console can change wallet state (setlabel, importaddress, ...)
+    return result.to_json('result')
+
+def _import_privkey_task(name, privkey, label, rescan):
+    result = coral_rpc('importprivkey', [privkey, label, rescan], wallet=name, timeout=300)  # Long timeout for rescan
+    _invalidate_address_info()
+    if result.error == 'Command timed out':
+        return {'error': 'Import timed out (rescan may still be in progress)'}
+    if not result.ok:
+        return result.payload()
+    return {'success': True, 'message': 'Private key imported successfully'}
 
 @app.route('/api/wallet/<name>/importprivkey', methods=['POST'])
 def import_privkey(name):
-    """Import private key into wallet"""
+    """Import private key into wallet
+
+    The import (and its rescan) runs in the background: this returns
+    {'task_id': ...} immediately, and /api/task/<task_id> reports the
+    outcome once done.
+    """
     data = request.json or {}
     privkey = data.get('privkey', '')
     label = data.get('label', '')
-    rescan = 'true' if data.get('rescan', True) else 'false'
+    rescan = bool(data.get('rescan', True))
 
     if not privkey:
         return jsonify({'error': 'No private key provided'})
 
-    cmd = [CORAL_CLI, f'-datadir={DATADIR}', f'-rpcwallet={name}', 'importprivkey', privkey, label, rescan]
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)  # Long timeout for rescan
-        if result.returncode == 0:
-            return jsonify({'success': True, 'message': 'Private key imported successfully'})
-        return jsonify({'error': result.stderr.strip()})
-    except subprocess.TimeoutExpired:
-        return jsonify({'error': 'Import timed out (rescan may still be in progress)'})
-    except Exception as e:
-        return jsonify({'error': str(e)})
+    task_id, err = submit_task(_import_privkey_task, name, privkey, label, rescan)
+    return jsonify({'error': err} if err else {'task_id': task_id})
 
 @app.route('/api/wallet/<name>/send', methods=['POST'])
 def send_transaction(name):
@@ -272,14 +665,7 @@ def send_transaction(name):
     if not amount or float(amount) <= 0:
         return jsonify({'error': 'Invalid amount'})
 
-    cmd = [CORAL_CLI, f'-datadir={DATADIR}', f'-rpcwallet={name}', 'sendtoaddress', address, str(amount)]
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-        if result.returncode == 0:
-            return jsonify({'txid': result.stdout.strip()})
-        return jsonify({'error': result.stderr.strip()})
-    except Exception as e:
-        return jsonify({'error': str(e)})
+    return coral_rpc('sendtoaddress', [address, amount], wallet=name, timeout=60).to_json('txid')
 
 @app.route('/api/loadwallet', methods=['POST'])
 def load_wallet():
@@ -290,7 +676,8 @@ def load_wallet():
         return jsonify({'error': 'No wallet name provided'})
 
     result = coral_cli('loadwallet', name)
-    return jsonify(result)
+    _invalidate_address_info()
+    return result.to_json()
 
 @app.route('/api/unloadwallet', methods=['POST'])
 def unload_wallet():
@@ -301,71 +688,54 @@ def unload_wallet():
         return jsonify({'error': 'No wallet name provided'})
 
     result = coral_cli('unloadwallet', name)
-    return jsonify(result)
-
-@app.route('/api/listwalletdir')
-def list_wallet_dir():
-    """List wallets in wallet directory"""
-    result = coral_cli('listwalletdir')
-    return jsonify(result)
+    _invalidate_address_info()
+    return result.to_json()
 
 @app.route('/api/recentblocks')
 def get_recent_blocks():
     """Get recent blocks"""
     blocks = []
     blockchain = coral_cli('getblockchaininfo')
-    if isinstance(blockchain, dict) and 'blocks' in blockchain:
-        height = blockchain['blocks']
-        # Get last 10 blocks
-        for i in range(min(10, height + 1)):
-            block_height = height - i
-            blockhash = coral_cli('getblockhash', str(block_height))
-            if isinstance(blockhash, str):
-                block = coral_cli('getblock', blockhash)
-                if isinstance(block, dict):
-                    blocks.append({
-                        'height': block_height,
-                        'hash': blockhash,
-                        'time': block.get('time', 0),
-                        'tx_count': len(block.get('tx', [])),
-                        'size': block.get('size', 0),
-                        'weight': block.get('weight', 0)
-                    })
+    if blockchain.ok:
+        height = blockchain.value['blocks']
+        # Get last 10 blocks: one batch for the hashes, one for the blocks
+        heights = [height - i for i in range(min(10, height + 1))]
+        hashes = coral_cli_batch([('getblockhash', (h,)) for h in heights])
+        found = [(h, blockhash.value) for h, blockhash in zip(heights, hashes) if blockhash.ok]
+        headers = coral_cli_batch([('getblock', (blockhash,)) for _, blockhash in found])
+        blocks = [{
+            'height': h,
+            'hash': blockhash,
+            'time': block.value.get('time', 0),
+            'tx_count': len(block.value.get('tx', [])),
+            'size': block.value.get('size', 0),
+            'weight': block.value.get('weight', 0)
+        } for (h, blockhash), block in zip(found, headers) if block.ok]
     return jsonify({'blocks': blocks})
 
 @app.route('/api/chainstate')
 def get_chainstate():
     """Get chain state info"""
-    blockchain = coral_cli('getblockchaininfo')
-    txoutset = coral_cli('gettxoutsetinfo')
+    blockchain, txoutset = coral_cli_batch([('getblockchaininfo', ()), ('gettxoutsetinfo', ())])
     return jsonify({
-        'blockchain': blockchain,
-        'txoutset': txoutset
+        'blockchain': blockchain.payload(),
+        'txoutset': txoutset.payload()
     })
 
 @app.route('/api/networkdetails')
 def get_network_details():
     """Get detailed network info"""
-    network = coral_cli('getnetworkinfo')
-    nettotals = coral_cli('getnettotals')
+    network, nettotals = coral_cli_batch([('getnetworkinfo', ()), ('getnettotals', ())])
     return jsonify({
-        'network': network,
-        'nettotals': nettotals
+        'network': network.payload(),
+        'nettotals': nettotals.payload()
     })
 
 @app.route('/api/localaddresses')
 def get_local_addresses():
     """Get local addresses"""
     network = coral_cli('getnetworkinfo')
-    if isinstance(network, dict):
-        return jsonify({'localaddresses': network.get('localaddresses', [])})
-    return jsonify({'localaddresses': []})
-
-@app.route('/api/banned')
-def get_banned():
-    """Get banned peers"""
-    result = coral_cli('listbanned')
-    return jsonify({'banned': result if isinstance(result, list) else []})
+    return jsonify({'localaddresses': network.value.get('localaddresses', []) if network.ok else []})
 
 @app.route('/api/addnode', methods=['POST'])
 def add_node():
@@ -377,8 +747,7 @@ def add_node():
     if not node:
         return jsonify({'error': 'No node address provided'})
 
-    result = coral_cli('addnode', node, command)
-    return jsonify({'result': result})
+    return coral_cli('addnode', node, command).to_json('result')
 
 @app.route('/api/disconnectnode', methods=['POST'])
 def disconnect_node():
@@ -389,14 +758,7 @@ def disconnect_node():
     if not address:
         return jsonify({'error': 'No address provided'})
 
-    result = coral_cli('disconnectnode', address)
-    return jsonify({'result': result})
-
-@app.route('/api/rawmempool')
-def get_raw_mempool():
-    """Get raw mempool with details"""
-    result = coral_cli('getrawmempool', 'true')
-    return jsonify(result)
+    return coral_cli('disconnectnode', address).to_json('result')
 
 @app.route('/api/decodetx', methods=['POST'])
 def decode_tx():
@@ -406,15 +768,20 @@ def decode_tx():
 
     if not rawtx:
         return jsonify({'error': 'No raw transaction provided'})
+    raw = _norm_hex(rawtx)
+    if raw is None:
+        return jsonify({'error': 'Invalid hex'})
 
-    result = coral_cli('decoderawtransaction', rawtx)
-    return jsonify(result)
+    return coral_cli('decoderawtransaction', raw.hex()).to_json()
 
 @app.route('/api/rawtx/<txid>')
 def get_raw_tx(txid):
     """Get raw transaction"""
-    result = coral_cli('getrawtransaction', txid, '1')
-    return jsonify(result)
+    txid = _norm_txid(txid)
+    if txid is None:
+        return jsonify({'error': 'Invalid txid'})
+
+    return coral_cli('getrawtransaction', txid, 1).to_json()
 
 @app.route('/api/broadcast', methods=['POST'])
 def broadcast_tx():
@@ -424,62 +791,23 @@ def broadcast_tx():
 
     if not rawtx:
         return jsonify({'error': 'No raw transaction provided'})
+    raw = _norm_hex(rawtx)
+    if raw is None:
+        return jsonify({'error': 'Invalid hex'})
 
-    result = coral_cli('sendrawtransaction', rawtx)
-    return jsonify({'txid': result if isinstance(result, str) else result})
+    return coral_cli('sendrawtransaction', raw.hex()).to_json('txid')
 
 @app.route('/api/debuginfo')
 def get_debug_info():
     """Get debug information"""
+    blockchain, network, memory = coral_cli_batch([('getblockchaininfo', ()), ('getnetworkinfo', ()), ('getmemoryinfo', ())])
     info = {
-        'blockchain': coral_cli('getblockchaininfo'),
-        'network': coral_cli('getnetworkinfo'),
-        'memory': coral_cli('getmemoryinfo'),
+        'blockchain': blockchain.payload(),
+        'network': network.payload(),
+        'memory': memory.payload(),
     }
     return jsonify(info)
 
-@app.route('/api/chaintips')
-def get_chain_tips():
-    """Get chain tips"""
-    result = coral_cli('getchaintips')
-    return jsonify({'chaintips': result if isinstance(result, list) else []})
-
-@app.route('/api/deploymentinfo')
-def get_deployment_info():
-    """Get deployment info"""
-    result = coral_cli('getdeploymentinfo')
-    return jsonify(result)
-
-@app.route('/api/rpcinfo')
-def get_rpc_info():
-    """Get RPC info"""
-    result = coral_cli('getrpcinfo')
-    return jsonify(result)
-
-@app.route('/api/uptime')
-def get_uptime():
-    """Get node uptime"""
-    result = coral_cli('uptime')
-    return jsonify({'uptime': result})
-
-@app.route('/api/getblocktemplate')
-def get_block_template():
-    """Get block template for mining"""
-    result = coral_cli('getblocktemplate', '{"rules":["segwit"]}')
-    return jsonify(result)
-
-@app.route('/api/estimatesmartfee/<int:blocks>')
-def estimate_smart_fee(blocks):
-    """Estimate smart fee for confirmation in n blocks"""
-    result = coral_cli('estimatesmartfee', str(blocks))
-    return jsonify(result)
-
-@app.route('/api/validateaddress/<address>')
-def validate_address(address):
-    """Validate an address"""
-    result = coral_cli('validateaddress', address)
-    return jsonify(result)
-
 @app.route('/api/wallet/<name>/signmessage', methods=['POST'])
 def sign_message(name):
     """Sign a message with a wallet address"""
@@ -490,14 +818,7 @@ def sign_message(name):
     if not address or not message:
         return jsonify({'error': 'Address and message required'})
 
-    cmd = [CORAL_CLI, f'-datadir={DATADIR}', f'-rpcwallet={name}', 'signmessage', address, message]
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return jsonify({'signature': result.stdout.strip()})
-        return jsonify({'error': result.stderr.strip()})
-    except Exception as e:
-        return jsonify({'error': str(e)})
+    return coral_rpc('signmessage', [address, message], wallet=name).to_json('signature')
 
 @app.route('/api/verifymessage', methods=['POST'])
 def verify_message():
@@ -510,8 +831,7 @@ def verify_message():
     if not address or not signature or not message:
         return jsonify({'error': 'Address, signature, and message required'})
 
-    result = coral_cli('verifymessage', address, signature, message)
-    return jsonify({'valid': result})
+    return coral_cli('verifymessage', address, signature, message).to_json('valid')
 
 @app.route('/api/wallet/<name>/dumpprivkey', methods=['POST'])
 def dump_privkey(name):
@@ -522,47 +842,88 @@ def dump_privkey(name):
     if not address:
         return jsonify({'error': 'No address provided'})
 
-    cmd = [CORAL_CLI, f'-datadir={DATADIR}', f'-rpcwallet={name}', 'dumpprivkey', address]
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return jsonify({'privkey': result.stdout.strip()})
-        return jsonify({'error': result.stderr.strip()})
-    except Exception as e:
-        return jsonify({'error': str(e)})
+    return coral_rpc('dumpprivkey', [address], wallet=name).to_json('privkey')
+
+def _rescan_task(name, start_height):
+    result = coral_rpc('rescanblockchain', [start_height], wallet=name, timeout=600)  # Long timeout
+    _invalidate_address_info()
+    if result.error == 'Command timed out':
+        return {'error': 'Rescan timed out (may still be in progress)'}
+    return result.payload()
 
 @app.route('/api/wallet/<name>/getaddressinfo/<address>')
 def get_address_info(name, address):
     """Get address info"""
-    cmd = [CORAL_CLI, f'-datadir={DATADIR}', f'-rpcwallet={name}', 'getaddressinfo', address]
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return jsonify(json.loads(result.stdout))
-        return jsonify({'error': result.stderr.strip()})
-    except Exception as e:
-        return jsonify({'error': str(e)})
+    key = (name, address)
+    with _cache_lock:
+        result = _address_info_cache.get(key)
+    if result is None:
+        result = coral_rpc('getaddressinfo', [address], wallet=name)
+        if result.ok:
+            with _cache_lock:
+                _address_info_cache[key] = result
+    return result.to_json()
 
 @app.route('/api/wallet/<name>/rescanblockchain', methods=['POST'])
 def rescan_blockchain(name):
-    """Rescan blockchain for wallet transactions"""
-    data = request.json or {}
-    start_height = data.get('start_height', 0)
+    """Rescan blockchain for wallet transactions
 
-    cmd = [CORAL_CLI, f'-datadir={DATADIR}', f'-rpcwallet={name}', 'rescanblockchain', str(start_height)]
+    The rescan runs in the background: this returns {'task_id': ...}
+    immediately, and /api/task/<task_id> reports the outcome once done.
+    """
+    data = request.json or {}
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)  # Long timeout
-        if result.returncode == 0:
-            return jsonify(json.loads(result.stdout))
-        return jsonify({'error': result.stderr.strip()})
-    except subprocess.TimeoutExpired:
-        return jsonify({'error': 'Rescan timed out (may still be in progress)'})
-    except Exception as e:
-        return jsonify({'error': str(e)})
+        start_height = int(data.get('start_height', 0))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'Invalid start height'})
+
+    task_id, err = submit_task(_rescan_task, name, start_height)
+    return jsonify({'error': err} if err else {'task_id': task_id})
+
+@app.route('/api/task/<task_id>')
+def get_task(task_id):
+    """Get status of a background task; finished tasks are forgotten once reported"""
+    # Task ids are uuid4 hex strings; anything else must not reach the filesystem
+    state = _read_task(_task_path(task_id)) if len(task_id) == 32 and all(c in string.hexdigits for c in task_id) else None
+    if state is None:
+        return jsonify({'error': 'Unknown task'})
+    if state.get('done'):
+        try:
+            os.remove(_task_path(task_id))
+        except OSError:
+            pass
+    return jsonify(state)
+
+@app.route('/api/events')
+def events():
+    """Server-Sent Events stream of new blocks and transactions (requires corald -zmqpubhashblock/-zmqpubhashtx)"""
+    _ensure_listener()
+    q = queue.Queue(maxsize=100)
+
+    def stream():
+        # Register inside the generator: its finally only runs once iteration has started,
+        # so a response that is never iterated must not leave a queue behind
+        with _subscribers_lock:
+            _subscribers.append(q)
+        try:
+            yield ': connected\n\n'
+            while True:
+                try:
+                    event = q.get(timeout=15)
+                except queue.Empty:
+                    yield ': keepalive\n\n'
+                    continue
+                yield f'data: {orjson.dumps(event).decode()}\n\n'
+        finally:
+            with _subscribers_lock:
+                _subscribers.remove(q)
+
+    return Response(stream(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 if __name__ == '__main__':
     print("Coral Web Dashboard")
-    print(f"Using coral-cli: {CORAL_CLI}")
+    print(f"Using RPC endpoint: {RPC_URL}")
     print(f"Data directory: {DATADIR}")
-    print("\nStarting server on http://localhost:5999")
-    app.run(debug=True, host='0.0.0.0', port=5999)
+    print("\nStarting development server on http://localhost:5999")
+    print("For production use: gunicorn -c gunicorn.conf.py wsgi:app")
+    app.run(host='0.0.0.0', port=5999)
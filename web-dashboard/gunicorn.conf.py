@@ -0,0 +1,14 @@
+# Gunicorn configuration for the Coral Web Dashboard
+# Usage: gunicorn -c gunicorn.conf.py wsgi:app
+
+bind = '0.0.0.0:5999'
+
+# Every route waits on the node's RPC server, so use greenlet workers that
+# keep serving other requests while one is blocked on I/O
+worker_class = 'gevent'
+# Background task state is kept on disk (see TASK_DIR in app.py), so any worker can answer /api/task polls
+workers = 2
+worker_connections = 1000
+
+keepalive = 5
+timeout = 60
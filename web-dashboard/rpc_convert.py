@@ -0,0 +1,101 @@
+"""
+Which console arguments coral-cli parses as JSON
+
+Mirrors vRPCConvertParams in src/rpc/client.cpp: only the (method, index)
+positions listed here are converted; every other argument is sent as a string.
+"""
+
+CONVERT_PARAMS = {
+    'setmocktime': frozenset({0}),
+    'mockscheduler': frozenset({0}),
+    'utxoupdatepsbt': frozenset({1}),
+    'generatetoaddress': frozenset({0, 2}),
+    'generatetodescriptor': frozenset({0, 2}),
+    'generateblock': frozenset({1}),
+    'getnetworkhashps': frozenset({0, 1}),
+    'sendtoaddress': frozenset({1, 4, 5, 6, 8, 9, 10}),
+    'settxfee': frozenset({0}),
+    'sethdseed': frozenset({0}),
+    'getreceivedbyaddress': frozenset({1, 2}),
+    'getreceivedbylabel': frozenset({1, 2}),
+    'listreceivedbyaddress': frozenset({0, 1, 2, 4}),
+    'listreceivedbylabel': frozenset({0, 1, 2, 3}),
+    'getbalance': frozenset({1, 2, 3}),
+    'getblockfrompeer': frozenset({1}),
+    'getblockhash': frozenset({0}),
+    'waitforblockheight': frozenset({0, 1}),
+    'waitforblock': frozenset({1}),
+    'waitfornewblock': frozenset({0}),
+    'listtransactions': frozenset({1, 2, 3}),
+    'walletpassphrase': frozenset({1}),
+    'getblocktemplate': frozenset({0}),
+    'listsinceblock': frozenset({1, 2, 3, 4}),
+    'sendmany': frozenset({1, 2, 4, 5, 6, 8, 9}),
+    'deriveaddresses': frozenset({1}),
+    'scantxoutset': frozenset({1}),
+    'addmultisigaddress': frozenset({0, 1}),
+    'createmultisig': frozenset({0, 1}),
+    'listunspent': frozenset({0, 1, 2, 3, 4}),
+    'getblock': frozenset({1}),
+    'getblockheader': frozenset({1}),
+    'getchaintxstats': frozenset({0}),
+    'gettransaction': frozenset({1, 2}),
+    'getrawtransaction': frozenset({1}),
+    'createrawtransaction': frozenset({0, 1, 2, 3}),
+    'decoderawtransaction': frozenset({1}),
+    'signrawtransactionwithkey': frozenset({1, 2}),
+    'signrawtransactionwithwallet': frozenset({1}),
+    'sendrawtransaction': frozenset({1}),
+    'testmempoolaccept': frozenset({0, 1}),
+    'submitpackage': frozenset({0}),
+    'combinerawtransaction': frozenset({0}),
+    'fundrawtransaction': frozenset({1, 2}),
+    'walletcreatefundedpsbt': frozenset({0, 1, 2, 3, 4}),
+    'walletprocesspsbt': frozenset({1, 3, 4}),
+    'createpsbt': frozenset({0, 1, 2, 3}),
+    'combinepsbt': frozenset({0}),
+    'joinpsbts': frozenset({0}),
+    'finalizepsbt': frozenset({1}),
+    'converttopsbt': frozenset({1, 2}),
+    'gettxout': frozenset({1, 2}),
+    'gettxoutproof': frozenset({0}),
+    'gettxoutsetinfo': frozenset({1, 2}),
+    'lockunspent': frozenset({0, 1, 2}),
+    'send': frozenset({0, 1, 3, 4}),
+    'sendall': frozenset({0, 1, 3, 4}),
+    'simulaterawtransaction': frozenset({0, 1}),
+    'importprivkey': frozenset({2}),
+    'importaddress': frozenset({2, 3}),
+    'importpubkey': frozenset({2}),
+    'importmulti': frozenset({0, 1}),
+    'importdescriptors': frozenset({0}),
+    'listdescriptors': frozenset({0}),
+    'verifychain': frozenset({0, 1}),
+    'getblockstats': frozenset({0, 1}),
+    'pruneblockchain': frozenset({0}),
+    'keypoolrefill': frozenset({0}),
+    'getrawmempool': frozenset({0, 1}),
+    'estimatesmartfee': frozenset({0}),
+    'estimaterawfee': frozenset({0, 1}),
+    'prioritisetransaction': frozenset({1, 2}),
+    'setban': frozenset({2, 3}),
+    'setnetworkactive': frozenset({0}),
+    'setwalletflag': frozenset({1}),
+    'getmempoolancestors': frozenset({1}),
+    'getmempooldescendants': frozenset({1}),
+    'gettxspendingprevout': frozenset({0}),
+    'bumpfee': frozenset({1}),
+    'psbtbumpfee': frozenset({1}),
+    'logging': frozenset({0, 1}),
+    'disconnectnode': frozenset({1}),
+    'upgradewallet': frozenset({0}),
+    'echojson': frozenset({0, 1, 2, 3, 4, 5, 6, 7, 8, 9}),
+    'rescanblockchain': frozenset({0, 1}),
+    'createwallet': frozenset({1, 2, 4, 5, 6, 7}),
+    'restorewallet': frozenset({2}),
+    'loadwallet': frozenset({1}),
+    'unloadwallet': frozenset({1}),
+    'getnodeaddresses': frozenset({0}),
+    'addpeeraddress': frozenset({1, 2}),
+    'stop': frozenset({0}),
+}
@@ -10,7 +10,7 @@ source venv/bin/activate
 # Check if corald is running
 if ! pgrep -x "corald" > /dev/null; then
     echo "Warning: corald is not running!"
-    echo "Start it with: src/corald -daemon -datadir=/tmp/coral-test"
+    echo "Start it with: src/corald -daemon -datadir=/tmp/coral-test -zmqpubhashblock=tcp://127.0.0.1:28332 -zmqpubhashtx=tcp://127.0.0.1:28332"
     echo ""
 fi
 
@@ -18,4 +18,4 @@ echo "Starting Coral Web Dashboard..."
 echo "Open http://localhost:5999 in your browser"
 echo ""
 
-python app.py
+exec gunicorn -c gunicorn.conf.py wsgi:app
@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for running the Coral Web Dashboard under gunicorn
+"""
+
+# Patch sockets before requests/urllib3 are imported so RPC waits yield to other greenlets
+from gevent import monkey
+monkey.patch_all()
+
+from app import app  # noqa: E402,F401